@@ -9,6 +9,7 @@ from pounders.solve_auxiliary import compute_fnorm
 from pounders.solve_auxiliary import find_nearby_points
 from pounders.solve_auxiliary import get_params_quadratic_model
 from pounders.solve_auxiliary import improve_model
+from pounders.solve_auxiliary import PoundersWorkspace
 from pounders.solve_auxiliary import solve_subproblem
 
 
@@ -29,7 +30,7 @@ def solve_pounders(
     c2: int,
     maxiter: int,
     gtol_sub: float,
-    solver_sub: str = "trust-constr",
+    solver_sub: str = "trust-exact",
     lower_bounds: Optional[np.ndarray] = None,
     upper_bounds: Optional[np.ndarray] = None,
 ) -> Tuple[np.ndarray, np.ndarray]:
@@ -52,7 +53,11 @@ def solve_pounders(
         maxiter (int): Maximum number of iterations. If reached, terminate.
         gtol_sub (float): Gradient norm used in the subproblem.
         solver_sub (str): Bound-constraint minimizer for the subproblem.
-            Currently, three solvers from the scipy library are supported.
+            The default "trust-exact" solves the quadratic model directly
+            via the More-Sorensen algorithm and projects the solution onto
+            the bounds. Alternatively, three solvers from the scipy library
+            are supported.
+            - "trust-exact"
             - "trust-constr"
             - "L-BFGS-B"
             - "SLSQP"
@@ -76,6 +81,7 @@ def solve_pounders(
     fnorm = np.zeros(maxiter + 1)
     hess = np.zeros((nobs, n, n))
     model_indices = np.zeros(maxinterp, dtype=int)
+    workspace = PoundersWorkspace.from_dimensions(n=n, nobs=nobs, maxinterp=maxinterp)
 
     last_mpoints = 0
     niter = 0
@@ -294,10 +300,12 @@ def solve_pounders(
             maxinterp=maxinterp,
             mpoints=mpoints,
             nhist=nhist,
+            workspace=workspace,
         )
 
         xk = (xhist[model_indices[:mpoints]] - xmin) / delta_old
-        res = np.zeros((maxinterp, nobs))
+        res = workspace.res
+        res.fill(0)
 
         for j in range(nobs):
             xk_hess = np.dot(xk, hess[j, :, :])
@@ -318,7 +326,7 @@ def solve_pounders(
 
         fmin = fhist[minindex]
         fnorm_min = fnorm[minindex]
-        jac_res, hess_res = calc_res(fdiff=fdiff, fmin=fmin, hess=hess)
+        jac_res, hess_res = calc_res(fdiff=fdiff, fmin=fmin, hess=hess, out=hess_res)
 
         solution = xhist[minindex, :]
         gradient = jac_res
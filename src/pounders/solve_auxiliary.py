@@ -1,12 +1,53 @@
-from functools import partial
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict
 from typing import Optional
 from typing import Tuple
 
 import numpy as np
-from scipy.linalg import qr_multiply
+from numba import njit
+from scipy.linalg import cho_factor
+from scipy.linalg import cho_solve
+from scipy.linalg import eigvalsh
+from scipy.linalg import lu_factor
+from scipy.linalg import lu_solve
+from scipy.linalg.lapack import get_lapack_funcs
 from scipy.optimize import Bounds
 from scipy.optimize import minimize
+from scipy.optimize import OptimizeResult
+
+_geqrf, _orgqr = get_lapack_funcs(
+    ("geqrf", "orgqr"), (np.empty((1, 1), dtype=np.float64),)
+)
+
+_SQRT2 = np.sqrt(2.0)
+_INV_SQRT2 = 1.0 / _SQRT2
+
+
+@dataclass
+class PoundersWorkspace:
+    """Buffers allocated once per solve and reused across iterations.
+    Attributes:
+        M (np.ndarray): Polynomial part of the interpolation matrix.
+            Shape (*maxinterp*, *n* + 1).
+        N (np.ndarray): Quadratic-basis part of the interpolation matrix.
+            Shape (*maxinterp*, *n* (*n* + 1) / 2).
+        res (np.ndarray): Residuals of the interpolation points.
+            Shape (*maxinterp*, *nobs*).
+    """
+
+    M: np.ndarray
+    N: np.ndarray
+    res: np.ndarray
+
+    @classmethod
+    def from_dimensions(cls, n: int, nobs: int, maxinterp: int) -> "PoundersWorkspace":
+        """Allocate all buffers for the given problem dimensions."""
+        return cls(
+            M=np.zeros((maxinterp, n + 1)),
+            N=np.zeros((maxinterp, int(n * (n + 1) / 2))),
+            res=np.zeros((maxinterp, nobs)),
+        )
 
 
 def compute_fnorm(criterion_value: np.ndarray) -> float:
@@ -20,7 +61,10 @@ def compute_fnorm(criterion_value: np.ndarray) -> float:
 
 
 def calc_res(
-    fdiff: np.ndarray, fmin: np.ndarray, hess: np.ndarray
+    fdiff: np.ndarray,
+    fmin: np.ndarray,
+    hess: np.ndarray,
+    out: Optional[np.ndarray] = None,
 ) -> Tuple[np.ndarray, np.ndarray]:
     """Calculate residuals of the Jacobian and Hessian.
     Args:
@@ -29,19 +73,22 @@ def calc_res(
         fmin (np.ndarray): Values of criterion function associated with
             parameter vector x that yields the lowest criterion function norm.
         hess (np.ndarray): Hessian matrix. Shape (*nobs*, *n*, *n*).
+        out (np.ndarray): Buffer for the Hessian residuals, reused across
+            iterations to avoid reallocating. Shape (*n*, *n*).
     Returns:
         Tuple:
         - jac_res (np.ndarray): Residuals of the Jacobian. Shape (*n*,).
         - hess_res (np.ndarray): Residuals of the Hessian. Shape (*n*, *n*).
     """
     jac_res = np.dot(fdiff, fmin)
-    hess_res = np.dot(fdiff, fdiff.T)
-
-    dim_array = np.ones((1, hess.ndim), int).ravel()
-    dim_array[0] = -1
-    fmin_reshaped = fmin.reshape(dim_array)
+    if out is None:
+        hess_res = np.dot(fdiff, fdiff.T)
+    else:
+        hess_res = np.dot(fdiff, fdiff.T, out=out)
 
-    hess_res += np.sum(fmin_reshaped * hess, axis=0)
+    # Contract in a single fused pass instead of materializing the full
+    # (nobs, n, n) broadcast product before reducing.
+    hess_res += np.einsum("k,kij->ij", fmin, hess)
 
     return jac_res, hess_res
 
@@ -52,7 +99,7 @@ def solve_subproblem(
     jac_res: np.ndarray,
     hess_res: np.ndarray,
     gtol: float = 1e-4,
-    solver: str = "trust-constr",
+    solver: str = "trust-exact",
     lower_bounds: Optional[np.ndarray] = None,
     upper_bounds: Optional[np.ndarray] = None,
 ) -> Dict[str, np.ndarray]:
@@ -65,7 +112,11 @@ def solve_subproblem(
         hess_res (np.ndarray): Residuals of the Hessian. Shape (*n*, *n*).
         gtol (float): Gradient tolerance. Stopping criterion.
         solver (str): Minimizer used to solve the bound-constraint subproblem.
-            Currently, three solvers from the scipy library are supported.
+            The default "trust-exact" solves the quadratic model directly
+            via the More-Sorensen algorithm and projects the solution onto
+            the bounds. Alternatively, three solvers from the scipy library
+            are supported.
+            - "trust-exact"
             - "trust-constr"
             - "L-BFGS-B"
             - "SLSQP"
@@ -104,30 +155,50 @@ def solve_subproblem(
     if np.max(x0 - upper_bounds) > 1e-10:
         raise ValueError("Initial guess > upper bounds in subproblem.")
 
-    bounds = Bounds(lower_bounds, upper_bounds)
-
-    if solver == "trust-constr":
-        solver_args = {"hess": "2-point"}
-        options = {"xtol": 1e-10, "gtol": gtol}
-    elif solver in ["L-BFGS-B", "SLSQP"]:
-        solver_args = {}
-        options = {"gtol": gtol}
+    if solver == "trust-exact":
+        rslt = _minimize_quadratic_exact(
+            jac_res=jac_res,
+            hess_res=hess_res,
+            lower_bounds=lower_bounds,
+            upper_bounds=upper_bounds,
+            gtol=gtol,
+        )
     else:
-        raise ValueError("Specififed subproblem solver is not supported.")
-
-    evaluate_subproblem = partial(
-        _evaluate_obj_and_grad, jac_res=jac_res, hess_res=hess_res
-    )
-
-    rslt = minimize(
-        evaluate_subproblem,
-        x0,
-        method=solver,
-        jac=True,
-        bounds=bounds,
-        **solver_args,
-        options=options,
-    )
+        bounds = Bounds(lower_bounds, upper_bounds)
+
+        if solver == "trust-constr":
+            # The subproblem objective is exactly quadratic, so the Hessian
+            # is constant and known. Supply it via Hessian-vector products
+            # instead of letting the solver approximate it with finite
+            # differences.
+            solver_args = {"hessp": lambda x, p: np.dot(hess_res, p)}
+            options = {"xtol": 1e-10, "gtol": gtol}
+        elif solver in ["L-BFGS-B", "SLSQP"]:
+            solver_args = {}
+            options = {"gtol": gtol}
+        else:
+            raise ValueError("Specififed subproblem solver is not supported.")
+
+        # Closure over a preallocated gradient buffer. The solvers consume
+        # the gradient before the next evaluation, so reusing the buffer
+        # avoids an allocation per call in their inner loops.
+        grad_buf = np.empty(n)
+
+        def evaluate_subproblem(x):
+            np.dot(hess_res, x, out=grad_buf)
+            obj = 0.5 * np.dot(grad_buf, x) + np.dot(jac_res, x)
+            np.add(grad_buf, jac_res, out=grad_buf)
+            return obj, grad_buf
+
+        rslt = minimize(
+            evaluate_subproblem,
+            x0,
+            method=solver,
+            jac=True,
+            bounds=bounds,
+            **solver_args,
+            options=options,
+        )
 
     # Test bounds post-solution
     if np.max(lower_bounds - rslt.x) > 1e-5:
@@ -176,28 +247,19 @@ def find_nearby_points(
             *qmat* and multiply *qmat* with vector *xk_plus*.
             Relevant for next call of *find_nearby_points*.
     """
-    for i in range(nhist - 1, -1, -1):
-        xk = (xhist[i, :] - xmin) / delta
-        normd = np.linalg.norm(xk)
-
-        xk_plus = xk
-
-        if normd <= c:
-            if q_is_I == 0:
-                xk_plus, _ = qr_multiply(qmat, xk_plus)
-
-            proj = np.linalg.norm(xk_plus[mpoints:])
-
-            # Add this index to the model
-            if proj >= theta1:
-                qmat = np.zeros((n, n))
-                model_indices[mpoints] = i
-                mpoints += 1
-                qmat[:, mpoints - 1] = xk
-                q_is_I = 0
-
-            if mpoints == n:
-                break
+    mpoints, q_is_I = _find_nearby_points_core(
+        xhist=xhist,
+        xmin=xmin,
+        qmat=qmat,
+        q_is_I=q_is_I,
+        delta=delta,
+        theta1=theta1,
+        c=c,
+        model_indices=model_indices,
+        n=n,
+        mpoints=mpoints,
+        nhist=nhist,
+    )
 
     return qmat, model_indices, mpoints, q_is_I
 
@@ -260,27 +322,14 @@ def improve_model(
         - mpoints (int): Current number of model points.
         - nhist (int): Current number candidate solutions for x.
     """
-    minindex_internal = 0
-    minvalue = np.inf
-    work = np.zeros(3)
-
-    qtmp, _ = qr_multiply(qmat, np.eye(3), mode="right")
+    qtmp = _qr_complete(qmat)[0]
 
-    for i in range(mpoints, n):
-        dp = np.dot(qtmp[:, i], jac_res)
-
-        # Model says use the other direction!
-        if dp > 0:
-            qtmp[:, i] *= -1
-
-        jac_res_new = jac_res + 0.5 * np.dot(hess_res, qtmp[:, i])
-        work[i] = np.dot(qtmp[:, i], jac_res_new)
-
-        if (i == mpoints) or (work[i] < minvalue):
-            minindex_internal = i
-            minvalue = work[i]
+    minindex_internal = _improve_model_core(
+        qtmp=qtmp, jac_res=jac_res, hess_res=hess_res, mpoints=mpoints, n=n
+    )
 
-        if addallpoints != 0:
+    if addallpoints != 0:
+        for i in range(mpoints, n):
             xhist, fhist, fnorm, model_indices, mpoints, nhist = _add_point(
                 xhist=xhist,
                 fhist=fhist,
@@ -296,8 +345,7 @@ def improve_model(
                 lower_bounds=lower_bounds,
                 upper_bounds=upper_bounds,
             )
-
-    if addallpoints == 0:
+    else:
         xhist, fhist, fnorm, model_indices, mpoints, nhist = _add_point(
             xhist=xhist,
             fhist=fhist,
@@ -329,6 +377,7 @@ def add_more_points(
     maxinterp: int,
     mpoints: int,
     nhist: int,
+    workspace: PoundersWorkspace,
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, int]:
     """Add more points.
     Args:
@@ -347,6 +396,8 @@ def add_more_points(
         maxinterp (int): Maximum number of interpolation points.
         mpoints (int): Current number of model points.
         nhist (int): Current number candidate solutions for x.
+        workspace (PoundersWorkspace): Preallocated buffers. Provides *M*
+            and *N*, which are overwritten and returned.
     Returns:
         Tuple:
         - L (np.ndarray): L matrix. Shape(*maxinterp*, *n* (*n* + 1) / 2).
@@ -355,70 +406,82 @@ def add_more_points(
         - M (np.ndarray): M matrix. Shape(*maxinterp*, *n* (*n* + 1) / 2).
         - mpoints (int): Current number of model points.
     """
-    M = np.zeros((maxinterp, n + 1))
-    N = np.zeros((maxinterp, int(n * (n + 1) / 2)))
+    M = workspace.M
+    N = workspace.N
+    M.fill(0)
+    N.fill(0)
     M[:, 0] = 1
 
-    for i in range(n + 1):
-        M[i, 1:] = (xhist[model_indices[i], :] - xmin) / delta
-        N[i, :] = _evaluate_phi(x=M[i, 1:], n=n)
+    # Division is several times slower than multiplication, so divide by
+    # delta once and multiply everywhere else.
+    inv_delta = 1.0 / delta
+
+    # Fill the rows for all n + 1 model points in one vectorized shot
+    # instead of evaluating phi row by row.
+    M[: n + 1, 1:] = (xhist[model_indices[: n + 1], :] - xmin) * inv_delta
+
+    diag_slots, row, col, off_slots = _quadratic_basis_slots(n)
+    X = M[: n + 1, 1:]
+    N[: n + 1, diag_slots] = 0.5 * X ** 2
+    N[: n + 1, off_slots] = X[:, row] * X[:, col] * _INV_SQRT2
 
     # Now we add points until we have maxinterp starting with the most recent ones
     point = nhist - 1
     mpoints = n + 1
 
-    while (mpoints < maxinterp) and (point >= 0):
-        # Reject any points already in the model
-        reject = 0
-
-        for i in range(n + 1):
-            if point == model_indices[i]:
-                reject = 1
-                break
+    # Maintain the complete QR factorization of the accepted point stack
+    # M[:mpoints] across candidates. Each candidate appends one row via
+    # Givens rotations in O(mpoints * n) instead of refactorizing from
+    # scratch, and the factorization is rolled back simply by not keeping
+    # the update when the candidate is rejected.
+    q_stack, r_stack = _qr_complete(M[: n + 1, :])
 
-        if reject == 0:
-            workxvec = xhist[point]
-            workxvec = workxvec - xhist[minindex]
-            normd = np.linalg.norm(workxvec)
-            normd /= delta
+    # Distances of all candidate points to the current center, computed
+    # in one pass instead of once per candidate.
+    distances = np.linalg.norm(xhist[:nhist] - xhist[minindex], axis=1) * inv_delta
 
-            if normd > c2:
-                reject = 1
+    # Points already in the model, as a mask for O(1) membership tests
+    in_model = np.zeros(nhist, dtype=bool)
+    in_model[model_indices[: n + 1]] = True
 
-        else:
+    while (mpoints < maxinterp) and (point >= 0):
+        # Reject points already in the model or too far from the center
+        # before any factorization work is spent on them
+        if in_model[point] or distances[point] > c2:
             point -= 1
             continue
 
-        M[mpoints, 1:] = (xhist[point] - xmin) / delta
+        M[mpoints, 1:] = (xhist[point] - xmin) * inv_delta
         N[mpoints, :] = _evaluate_phi(x=M[mpoints, 1:], n=n)
 
-        Q_tmp = np.zeros((7, 7))
-        Q_tmp[:7, : n + 1] = M
+        q_cand, r_cand = _qr_append_row(q_stack, r_stack, M[mpoints, :])
 
-        L_tmp, _ = qr_multiply(
-            Q_tmp[: mpoints + 1, :],
-            N.T[: int(n * (n + 1) / 2), : mpoints + 1],
-            mode="right",
-        )
-        beta = np.linalg.svd(L_tmp.T[n + 1 :], compute_uv=False)
+        # Projection of the phi block onto the null space of the
+        # polynomial part; its smallest singular value measures how much
+        # the candidate improves the quadratic geometry. The smallest
+        # singular value is obtained as the smallest eigenvalue of the
+        # (mpoints - n) sized Gram matrix, which is much cheaper than a
+        # full SVD of the projected block, and compared in squares.
+        L_tmp = np.dot(q_cand[:, n + 1 : mpoints + 1].T, N[: mpoints + 1, :])
+        min_sv_squared = eigvalsh(np.dot(L_tmp, L_tmp.T), check_finite=False)[0]
 
-        if beta[min(mpoints - n, int(n * (n + 1) / 2)) - 1] > theta2:
+        if min_sv_squared > theta2 ** 2:
             # Accept point
             model_indices[mpoints] = point
-            L = L_tmp
+            q_stack, r_stack = q_cand, r_cand
 
             mpoints += 1
 
         point -= 1
 
-    cq, _ = qr_multiply(
-        Q_tmp[:mpoints, :], np.eye(maxinterp)[:, :mpoints], mode="right"
-    )
-    Z = cq[:, n + 1 : mpoints]
+    Z = np.zeros((maxinterp, mpoints - n - 1))
+    Z[:mpoints, :] = q_stack[:, n + 1 : mpoints]
 
     if mpoints == (n + 1):
         L = np.zeros((maxinterp, int(n * (n + 1) / 2)))
         L[:n, :n] = np.eye(n)
+    else:
+        L = np.dot(N[:mpoints, :].T, q_stack)
 
     return L, Z, N, M, mpoints
 
@@ -454,40 +517,386 @@ def get_params_quadratic_model(
         - hess_quadratic (np.ndarray): Hessian of the quadratic model.
             Shape (*nobs*, *n*, *n*).
     """
-    jac_quadratic = np.zeros((nobs, n))
     hess_quadratic = np.zeros((nobs, n, n))
 
+    diag_slots, row, col, off_slots = _quadratic_basis_slots(n)
+    diag = np.arange(n)
+
     if mpoints == (n + 1):
-        omega = np.zeros(n)
-        beta = np.zeros(int(n * (n + 1) / 2))
+        beta = np.zeros((int(n * (n + 1) / 2), nobs))
     else:
-        L_tmp = np.dot(L[:, n + 1 : mpoints].T, L[:, n + 1 : mpoints])
+        # Solve L'*L*Omega = Z' * RES for all observations in one shot.
+        # L'*L is symmetric positive definite by construction (the theta2
+        # acceptance test bounds its smallest eigenvalue away from zero),
+        # so use a Cholesky factorization instead of a general LU solve.
+        L_null = L[:, n + 1 : mpoints]
+        L_tmp = np.dot(L_null.T, L_null)
 
-    for k in range(nobs):
-        if mpoints != (n + 1):
-            # Solve L'*L*Omega = Z' * RES_k
-            omega = np.dot(Z[:mpoints, :].T, res[:mpoints, k])
-            omega = np.linalg.solve(np.atleast_2d(L_tmp), np.atleast_1d(omega))
+        omega = np.dot(Z[:mpoints, :].T, res[:mpoints, :])
+        cho = cho_factor(L_tmp, overwrite_a=True, check_finite=False)
+        omega = cho_solve(cho, omega, overwrite_b=True, check_finite=False)
 
-            beta = np.dot(np.atleast_2d(L[:, n + 1 : mpoints]), omega)
+        beta = np.dot(L_null, omega)
 
-        rhs = res[:mpoints, k] - np.dot(N[:mpoints, :], beta)
+    rhs = res[:mpoints, :] - np.dot(N[:mpoints, :], beta)
 
-        alpha = np.linalg.solve(M[: n + 1, : n + 1], rhs[: n + 1])
-        jac_quadratic[k, :] = alpha[1 : (n + 1)]
+    lu = lu_factor(M[: n + 1, : n + 1], check_finite=False)
+    alpha = lu_solve(lu, rhs[: n + 1, :], check_finite=False)
+    jac_quadratic = alpha[1 : (n + 1), :].T
 
-        num = 0
-        for i in range(n):
-            hess_quadratic[k, i, i] = beta[num]
-            num += 1
-            for j in range(i + 1, n):
-                hess_quadratic[k, j, i] = beta[num] / np.sqrt(2)
-                hess_quadratic[k, i, j] = beta[num] / np.sqrt(2)
-                num += 1
+    hess_quadratic[:, diag, diag] = beta[diag_slots, :].T
+    off_diag = beta[off_slots, :].T * _INV_SQRT2
+    hess_quadratic[:, row, col] = off_diag
+    hess_quadratic[:, col, row] = off_diag
 
     return jac_quadratic, hess_quadratic
 
 
+@njit(cache=True)
+def _find_nearby_points_core(
+    xhist: np.ndarray,
+    xmin: np.ndarray,
+    qmat: np.ndarray,
+    q_is_I: int,
+    delta: float,
+    theta1: float,
+    c: float,
+    model_indices: np.ndarray,
+    n: int,
+    mpoints: int,
+    nhist: int,
+) -> Tuple[int, int]:
+    """Jit-compiled inner loop of *find_nearby_points*.
+    Mutates *qmat* and *model_indices* in place.
+    Args: see *find_nearby_points*.
+    Returns:
+        Tuple:
+        - mpoints (int): Current number of model points.
+        - q_is_I (int): Indicator whether to calculate the QR decomposition of
+            *qmat* and multiply *qmat* with vector *xk_plus*.
+    """
+    # Normalize all candidate points in one pass and compare squared
+    # norms against the squared threshold.
+    inv_delta = 1.0 / delta
+    D = (xhist[:nhist] - xmin) * inv_delta
+    norms_squared = np.sum(D * D, axis=1)
+    c_squared = c * c
+    theta1_squared = theta1 * theta1
+
+    i = nhist - 1
+
+    # While Q is the identity the projection is the candidate itself, so
+    # run a specialized loop without the QR branch until the first point
+    # is accepted, then switch to the general variant below.
+    if q_is_I != 0:
+        while i >= 0:
+            if norms_squared[i] <= c_squared:
+                xk = D[i, :]
+                tail = xk[mpoints:]
+                proj_squared = np.dot(tail, tail)
+
+                # Add this index to the model
+                if proj_squared >= theta1_squared:
+                    model_indices[mpoints] = i
+                    mpoints += 1
+                    qmat[:, mpoints - 1] = xk
+                    q_is_I = 0
+                    i -= 1
+                    break
+            i -= 1
+
+    # General variant: project each candidate with the Q factor of qmat,
+    # which only changes when a point is accepted and is therefore
+    # computed once per acceptance and reused in between.
+    q_current = np.empty((n, n))
+    q_is_stale = True
+
+    if mpoints < n:
+        while i >= 0:
+            if norms_squared[i] <= c_squared:
+                xk = D[i, :]
+
+                if q_is_stale:
+                    q_current = np.ascontiguousarray(np.linalg.qr(qmat)[0])
+                    q_is_stale = False
+                xk_plus = np.dot(xk, q_current)
+
+                tail = xk_plus[mpoints:]
+                proj_squared = np.dot(tail, tail)
+
+                # Add this index to the model
+                if proj_squared >= theta1_squared:
+                    model_indices[mpoints] = i
+                    mpoints += 1
+                    qmat[:, mpoints - 1] = xk
+                    q_is_stale = True
+
+                if mpoints == n:
+                    break
+            i -= 1
+
+    return mpoints, q_is_I
+
+
+def _qr_complete(a: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Complete QR factorization via direct LAPACK calls.
+    Equivalent to np.linalg.qr(a, mode="complete") but skips the wrapper
+    layer's validation and temporaries, which is noticeable for the tiny
+    matrices pounders factorizes repeatedly.
+    Args:
+        a (np.ndarray): Matrix to factorize. Shape (*m*, *k*).
+    Returns:
+        Tuple:
+        - q (np.ndarray): Orthogonal factor. Shape (*m*, *m*).
+        - r (np.ndarray): Triangular factor. Shape (*m*, *k*).
+    """
+    m, k = a.shape
+    qr_raw, tau, _, _ = _geqrf(a)
+    r = np.triu(qr_raw)
+
+    if k < m:
+        q_in = np.empty((m, m))
+        q_in[:, :k] = qr_raw
+    else:
+        q_in = qr_raw[:, :m]
+    q, _, _ = _orgqr(q_in, tau)
+
+    return q, r
+
+
+def _qr_append_row(
+    q: np.ndarray, r: np.ndarray, row: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Append a row to a complete QR factorization via Givens rotations.
+    Given A = q r with *q* of shape (*m*, *m*) and *r* of shape (*m*, *k*),
+    returns the complete QR factorization of A with *row* appended, in
+    O(*m* *k*) instead of a full refactorization.
+    Args:
+        q (np.ndarray): Orthogonal factor. Shape (*m*, *m*).
+        r (np.ndarray): Triangular factor. Shape (*m*, *k*).
+        row (np.ndarray): Row to append. Shape (*k*,).
+    Returns:
+        Tuple:
+        - q_new (np.ndarray): Updated orthogonal factor. Shape (*m* + 1, *m* + 1).
+        - r_new (np.ndarray): Updated triangular factor. Shape (*m* + 1, *k*).
+    """
+    m, k = r.shape
+
+    r_new = np.zeros((m + 1, k))
+    r_new[:m, :] = r
+    r_new[m, :] = row
+
+    q_new = np.zeros((m + 1, m + 1))
+    q_new[:m, :m] = q
+    q_new[m, m] = 1.0
+
+    for j in range(k):
+        if r_new[m, j] == 0:
+            continue
+
+        hyp = np.hypot(r_new[j, j], r_new[m, j])
+        cos = r_new[j, j] / hyp
+        sin = r_new[m, j] / hyp
+
+        row_j = cos * r_new[j, j:] + sin * r_new[m, j:]
+        r_new[m, j:] = cos * r_new[m, j:] - sin * r_new[j, j:]
+        r_new[j, j:] = row_j
+        r_new[m, j] = 0.0
+
+        col_j = cos * q_new[:, j] + sin * q_new[:, m]
+        q_new[:, m] = cos * q_new[:, m] - sin * q_new[:, j]
+        q_new[:, j] = col_j
+
+    return q_new, r_new
+
+
+@njit(cache=True)
+def _improve_model_core(
+    qtmp: np.ndarray,
+    jac_res: np.ndarray,
+    hess_res: np.ndarray,
+    mpoints: int,
+    n: int,
+) -> int:
+    """Jit-compiled direction loop of *improve_model*.
+    Flips the sign of descent-violating columns of *qtmp* in place and
+    returns the index of the direction with the lowest model value.
+    Args: see *improve_model*.
+    Returns:
+        (int): Index of the best model-improving direction.
+    """
+    minindex_internal = 0
+    minvalue = np.inf
+    work = np.zeros(n)
+
+    for i in range(mpoints, n):
+        qcol = qtmp[:, i].copy()
+        dp = np.dot(qcol, jac_res)
+
+        # Model says use the other direction!
+        if dp > 0:
+            qtmp[:, i] *= -1
+            qcol = -qcol
+
+        jac_res_new = jac_res + 0.5 * np.dot(hess_res, qcol)
+        work[i] = np.dot(qcol, jac_res_new)
+
+        if (i == mpoints) or (work[i] < minvalue):
+            minindex_internal = i
+            minvalue = work[i]
+
+    return minindex_internal
+
+
+def _minimize_quadratic_exact(
+    jac_res: np.ndarray,
+    hess_res: np.ndarray,
+    lower_bounds: np.ndarray,
+    upper_bounds: np.ndarray,
+    gtol: float,
+    maxiter: int = 100,
+) -> OptimizeResult:
+    """Minimize the quadratic model directly over the trust region.
+    Solves min 0.5 * x' * hess_res * x + jac_res' * x over the spherical
+    trust region ||x|| <= 1 with the More-Sorensen algorithm, then projects
+    the solution onto the bounds and polishes it with projected-gradient
+    steps. Avoids the per-iteration overhead of a general NLP solver on
+    what is an exactly quadratic subproblem.
+    Args:
+        jac_res (np.ndarray): Residuals of the Jacobian. Shape (*n*,).
+        hess_res (np.ndarray): Residuals of the Hessian. Shape (*n*, *n*).
+        lower_bounds (np.ndarray): Normalized lower bounds. Shape (*n*,).
+        upper_bounds (np.ndarray): Normalized upper bounds. Shape (*n*,).
+        gtol (float): Tolerance on the projected gradient norm.
+        maxiter (int): Maximum number of projected-gradient steps.
+    Returns:
+        (OptimizeResult): Result with attributes *x* and *fun*.
+    """
+    def _project(z):
+        # Feasible map onto the intersection of the bounds and the unit
+        # ball. The origin is always feasible, so scaling the clipped
+        # point back towards it cannot leave the box.
+        z = np.clip(z, lower_bounds, upper_bounds)
+        norm_z = np.linalg.norm(z)
+        if norm_z > 1:
+            z = z / norm_z
+        return z
+
+    x = _solve_trust_region_sphere(jac_res=jac_res, hess_res=hess_res)
+
+    if np.any(x < lower_bounds) or np.any(x > upper_bounds):
+        # The bounds are active. Project the spherical solution into the
+        # feasible region and polish it with projected-gradient steps.
+        # Start from the origin instead if the projection degraded the
+        # model value below the trivial step.
+        x = _project(x)
+        if _evaluate_obj_and_grad(x, jac_res, hess_res)[0] > 0:
+            x = np.zeros_like(jac_res)
+
+        step = 1.0
+        obj, grad = _evaluate_obj_and_grad(x, jac_res, hess_res)
+
+        for _ in range(maxiter):
+            grad_projected = _project(x - grad) - x
+
+            if np.linalg.norm(grad_projected) < gtol:
+                break
+
+            # Backtracking line search on the quadratic model
+            while step > 1e-12:
+                x_candidate = _project(x - step * grad)
+                obj_candidate = _evaluate_obj_and_grad(
+                    x_candidate, jac_res, hess_res
+                )[0]
+
+                if obj_candidate < obj:
+                    break
+                step *= 0.5
+
+            if obj_candidate >= obj:
+                break
+
+            x = x_candidate
+            obj, grad = _evaluate_obj_and_grad(x, jac_res, hess_res)
+            step = min(step * 2, 1.0)
+    else:
+        obj = _evaluate_obj_and_grad(x, jac_res, hess_res)[0]
+
+    return OptimizeResult(x=x, fun=obj)
+
+
+def _solve_trust_region_sphere(
+    jac_res: np.ndarray, hess_res: np.ndarray, radius: float = 1.0
+) -> np.ndarray:
+    """Solve the spherical trust-region subproblem exactly.
+    Implements the More-Sorensen algorithm via the eigendecomposition of
+    *hess_res*, which is cheap for the small dimensions pounders operates
+    on. Handles indefinite Hessians including the hard case.
+    Args:
+        jac_res (np.ndarray): Residuals of the Jacobian. Shape (*n*,).
+        hess_res (np.ndarray): Residuals of the Hessian. Shape (*n*, *n*).
+        radius (float): Trust-region radius.
+    Returns:
+        (np.ndarray): Minimizer of the quadratic model on the ball. Shape (*n*,).
+    """
+    eigvals, eigvecs = np.linalg.eigh(hess_res)
+    jac_rotated = np.dot(eigvecs.T, jac_res)
+
+    # Interior solution if the Hessian is positive definite
+    if eigvals[0] > 0:
+        x = -jac_rotated / eigvals
+        if np.dot(x, x) <= radius ** 2:
+            return np.dot(eigvecs, x)
+
+    # Boundary solution: find lam >= max(0, -eigvals[0]) such that
+    # ||(hess_res + lam * I)^-1 jac_res|| = radius via Newton's method
+    # on the secular equation.
+    lam = max(0.0, -eigvals[0])
+
+    smallest = eigvals - eigvals[0] <= 1e-12 * max(1.0, abs(eigvals[0]))
+    if np.all(np.abs(jac_rotated[smallest]) < 1e-12):
+        # Potential hard case: jac_res is (numerically) orthogonal to the
+        # eigenspace of the smallest eigenvalue. If the shifted solution
+        # lies strictly inside the ball, move to the boundary along that
+        # eigenspace.
+        denom = np.where(smallest, np.inf, eigvals + lam)
+        x = -jac_rotated / denom
+        if np.dot(x, x) < radius ** 2:
+            tau = np.sqrt(radius ** 2 - np.dot(x, x))
+            x[0] += tau
+            return np.dot(eigvecs, x)
+
+    lam_lower = lam
+    lam_upper = lam + np.linalg.norm(jac_rotated) / radius
+    lam = 0.5 * (lam_lower + lam_upper)
+
+    for _ in range(100):
+        denom = eigvals + lam
+        x = jac_rotated / denom
+        norm_x = np.linalg.norm(x)
+
+        if abs(norm_x - radius) < 1e-12 * radius:
+            break
+
+        if norm_x > radius:
+            lam_lower = lam
+        else:
+            lam_upper = lam
+
+        # Newton step on 1 / ||x(lam)|| - 1 / radius, which is close to
+        # linear in lam (More-Sorensen reformulation). Fall back to
+        # bisection whenever the step leaves the bracket.
+        secular_deriv = np.dot(x ** 2, 1 / denom)
+        lam_new = lam + (norm_x - radius) * norm_x ** 2 / (radius * secular_deriv)
+
+        if lam_lower < lam_new < lam_upper:
+            lam = lam_new
+        else:
+            lam = 0.5 * (lam_lower + lam_upper)
+
+    return np.dot(eigvecs, -jac_rotated / (eigvals + lam))
+
+
 def _evaluate_obj_and_grad(
     x: np.ndarray,
     jac_res: np.ndarray,
@@ -520,20 +929,39 @@ def _evaluate_phi(x: np.ndarray, n: int) -> np.ndarray:
     Returns:
         (np.ndarray): Phi vector. Shape (*n* (*n* + 1) / 2,)
     """
-    phi = np.zeros(int(n * (n + 1) / 2))
-
-    j = 0
-    for i in range(n):
-        phi[j] = 0.5 * x[i] * x[i]
-        j += 1
+    diag_slots, row, col, off_slots = _quadratic_basis_slots(n)
 
-        for k in range(i + 1, n):
-            phi[j] = x[i] * x[k] / np.sqrt(2)
-            j += 1
+    phi = np.empty(int(n * (n + 1) / 2))
+    phi[diag_slots] = 0.5 * x ** 2
+    phi[off_slots] = x[row] * x[col] * _INV_SQRT2
 
     return phi
 
 
+@lru_cache(maxsize=None)
+def _quadratic_basis_slots(
+    n: int,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Index map into the quadratic basis vector of length n (n + 1) / 2.
+    The basis interleaves diagonal and off-diagonal terms: for each i, the
+    slot for x(i)^2 is followed by the slots for x(i) * x(k), k > i.
+    Args:
+        n (int): Number of parameters.
+    Returns:
+        Tuple:
+        - diag_slots (np.ndarray): Slots of the diagonal terms. Shape (*n*,).
+        - row (np.ndarray): Row indices of the off-diagonal terms.
+        - col (np.ndarray): Column indices of the off-diagonal terms.
+        - off_slots (np.ndarray): Slots of the off-diagonal terms.
+    """
+    i = np.arange(n)
+    diag_slots = (i * (2 * n - i + 1)) // 2
+    row, col = np.triu_indices(n, k=1)
+    off_slots = diag_slots[row] + (col - row)
+
+    return diag_slots, row, col, off_slots
+
+
 def _add_point(
     xhist: np.ndarray,
     fhist: np.ndarray,